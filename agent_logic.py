@@ -4,20 +4,53 @@ Contains all research and planning tools used by the orchestrator and the main a
 """
 
 from langchain_core.tools import tool
-from tavily import TavilyClient
+from tavily import AsyncTavilyClient, TavilyClient
+import asyncio
 import os
+import re
+import time
+from collections import OrderedDict
+from typing import Optional
 from dotenv import load_dotenv
 
 load_dotenv()
 
-# Initialize Tavily client
+# Initialize Tavily clients (the async one serves the orchestrator's concurrent research)
 tavily_client = TavilyClient(api_key=os.getenv("TAVILY_API_KEY"))
+async_tavily_client = AsyncTavilyClient(api_key=os.getenv("TAVILY_API_KEY"))
 
 
 # ============================================================================
 # RESEARCH TOOLS (Used by Orchestrator in Step 2)
 # ============================================================================
 
+def _minimum_budget_query(city: str) -> str:
+    return f"Minimum daily budget cost for tourist in {city} India per person including budget accommodation food transport 2024 2025 rupees"
+
+
+def _minimum_budget_raw_content(response: dict) -> str:
+    """Joins the top search results handed to the budget extraction LLM"""
+    return "\n".join(result.get('content', '') for result in response.get('results', [])[:3])
+
+
+def _format_minimum_budget(city: str, response: dict, extracted_amount: int) -> str:
+    # Extract and format results, focusing on content with numbers
+    results = []
+    for result in response.get('results', []):
+        content = result.get('content', '')
+        # Prioritize results that contain currency symbols or numbers
+        if any(symbol in content for symbol in ['₹', 'Rs', 'INR', 'rupee', '$']):
+            results.append(f"• {content[:400]}")
+    
+    if not results:
+        # Fallback to all results if no currency found
+        for result in response.get('results', [])[:3]:
+            results.append(f"• {result.get('content', '')[:400]}")
+    
+    formatted_results = "\n\n".join(results)
+    return f"💰 Minimum Daily Budget for {city}, India:\n\n**EXTRACTED MINIMUM: ₹{extracted_amount} per person per day**\n\n{formatted_results}"
+
+
 @tool
 def get_minimum_daily_budget(city: str) -> str:
     """
@@ -33,60 +66,50 @@ def get_minimum_daily_budget(city: str) -> str:
         str: Research findings with a clear numerical minimum budget extracted
     """
     try:
-        query = f"Minimum daily budget cost for tourist in {city} India per person including budget accommodation food transport 2024 2025 rupees"
         response = tavily_client.search(
-            query=query,
+            query=_minimum_budget_query(city),
             search_depth="advanced",
             max_results=4
         )
         
-        # Extract and format results, focusing on content with numbers
-        results = []
-        raw_content = []
-        for result in response.get('results', []):
-            content = result.get('content', '')
-            raw_content.append(content)
-            # Prioritize results that contain currency symbols or numbers
-            if any(symbol in content for symbol in ['₹', 'Rs', 'INR', 'rupee', '$']):
-                results.append(f"• {content[:400]}")
-        
-        if not results:
-            # Fallback to all results if no currency found
-            for result in response.get('results', [])[:3]:
-                results.append(f"• {result.get('content', '')[:400]}")
-        
         # Use a simple LLM call to parse the numerical value
-        extracted_amount = extract_minimum_budget_from_text("\n".join(raw_content[:3]), city)
-        
-        formatted_results = "\n\n".join(results)
-        return f"💰 Minimum Daily Budget for {city}, India:\n\n**EXTRACTED MINIMUM: ₹{extracted_amount} per person per day**\n\n{formatted_results}"
+        extracted_amount = extract_minimum_budget_from_text(_minimum_budget_raw_content(response), city)
+        return _format_minimum_budget(city, response, extracted_amount)
     except Exception as e:
         return f"Error researching minimum budget for {city}: {str(e)}\n\n**EXTRACTED MINIMUM: ₹2500 per person per day** (fallback)"
 
 
-def extract_minimum_budget_from_text(search_results: str, city: str) -> int:
-    """
-    Uses a simple LLM call to parse only the numerical minimum daily budget value from search results.
-    
-    Args:
-        search_results: Raw text from Tavily search
-        city: City name for context
-        
-    Returns:
-        int: Minimum daily budget in INR per person
-    """
+async def _aget_minimum_daily_budget(city: str) -> str:
+    """Native async version of get_minimum_daily_budget (no worker thread needed)"""
     try:
-        from langchain_google_genai import ChatGoogleGenerativeAI
-        import os
-        
-        # Simple, fast model for extraction
-        llm = ChatGoogleGenerativeAI(
-            model="gemini-1.5-flash",
-            temperature=0,
-            google_api_key=os.getenv("GOOGLE_API_KEY")
+        response = await async_tavily_client.search(
+            query=_minimum_budget_query(city),
+            search_depth="advanced",
+            max_results=4
         )
         
-        extraction_prompt = f"""Extract the MINIMUM daily budget for a solo budget traveler in {city}, India from this text.
+        extracted_amount = await aextract_minimum_budget_from_text(_minimum_budget_raw_content(response), city)
+        return _format_minimum_budget(city, response, extracted_amount)
+    except Exception as e:
+        return f"Error researching minimum budget for {city}: {str(e)}\n\n**EXTRACTED MINIMUM: ₹2500 per person per day** (fallback)"
+
+
+get_minimum_daily_budget.coroutine = _aget_minimum_daily_budget
+
+
+def _budget_extraction_llm():
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    
+    # Simple, fast model for extraction
+    return ChatGoogleGenerativeAI(
+        model="gemini-1.5-flash",
+        temperature=0,
+        google_api_key=os.getenv("GOOGLE_API_KEY")
+    )
+
+
+def _budget_extraction_prompt(search_results: str, city: str) -> str:
+    return f"""Extract the MINIMUM daily budget for a solo budget traveler in {city}, India from this text.
 
 Search Results:
 {search_results[:1500]}
@@ -105,25 +128,108 @@ Examples:
 
 Return ONLY the number (integer)."""
 
-        response = llm.invoke(extraction_prompt)
+
+def _parse_extracted_budget(content) -> int:
+    # Extract number from response
+    numbers = re.findall(r'\d+', str(content))
+    if numbers:
+        amount = int(numbers[0])
+        # Sanity check: should be between 1000 and 20000 INR
+        if 1000 <= amount <= 20000:
+            return amount
+    
+    # Fallback
+    return 2500
+
+
+def extract_minimum_budget_from_text(search_results: str, city: str) -> int:
+    """
+    Uses a simple LLM call to parse only the numerical minimum daily budget value from search results.
+    
+    Args:
+        search_results: Raw text from Tavily search
+        city: City name for context
         
-        # Extract number from response
-        import re
-        numbers = re.findall(r'\d+', str(response.content))
-        if numbers:
-            amount = int(numbers[0])
-            # Sanity check: should be between 1000 and 20000 INR
-            if 1000 <= amount <= 20000:
-                return amount
+    Returns:
+        int: Minimum daily budget in INR per person
+    """
+    try:
+        response = _budget_extraction_llm().invoke(_budget_extraction_prompt(search_results, city))
+        return _parse_extracted_budget(response.content)
         
-        # Fallback
+    except Exception as e:
+        print(f"⚠️ Budget extraction error: {e}")
         return 2500
+
+
+async def aextract_minimum_budget_from_text(search_results: str, city: str) -> int:
+    """Async version of extract_minimum_budget_from_text"""
+    try:
+        response = await _budget_extraction_llm().ainvoke(_budget_extraction_prompt(search_results, city))
+        return _parse_extracted_budget(response.content)
         
     except Exception as e:
         print(f"⚠️ Budget extraction error: {e}")
         return 2500
 
 
+# Rupee fares quoted in transport search results
+_FARE_RE = re.compile(r'[₹Rs\.]\s*(\d{1,6})')
+
+
+def _transport_cost_query(origin: str, destination: str) -> str:
+    return f"cost of travel from {origin} to {destination} India round trip flight train bus fare rupees 2024 2025"
+
+
+# Route fare LRU cache ((origin, destination) casefolded → (per-person round-trip ₹,
+# time.monotonic() when cached)). Fares move slowly and popular routes are asked for
+# over and over; the cost is per person so any group size reuses the entry
+_transport_cost_cache: "OrderedDict[tuple[str, str], tuple[float, float]]" = OrderedDict()
+TRANSPORT_COST_CACHE_SECONDS = 6 * 3600  # 6 hours
+TRANSPORT_COST_CACHE_MAX_ENTRIES = 2048
+
+
+def _get_cached_route_cost(origin: str, destination: str) -> Optional[float]:
+    key = (origin.casefold(), destination.casefold())
+    entry = _transport_cost_cache.get(key)
+    if entry is None:
+        return None
+    per_person, cached_at = entry
+    if time.monotonic() - cached_at >= TRANSPORT_COST_CACHE_SECONDS:
+        _transport_cost_cache.pop(key, None)
+        return None
+    _transport_cost_cache.move_to_end(key)
+    return per_person
+
+
+def _cache_route_cost(origin: str, destination: str, per_person: float):
+    key = (origin.casefold(), destination.casefold())
+    _transport_cost_cache[key] = (per_person, time.monotonic())
+    _transport_cost_cache.move_to_end(key)
+    while len(_transport_cost_cache) > TRANSPORT_COST_CACHE_MAX_ENTRIES:
+        _transport_cost_cache.popitem(last=False)
+
+
+def _per_person_cost_from_results(response: dict) -> float:
+    """Median fare found in the search results, as a per-person round trip"""
+    all_prices = []
+    for result in response.get('results', []):
+        content = result.get('content', '')
+        # Find rupee amounts
+        rupee_matches = _FARE_RE.findall(content)
+        all_prices.extend([int(m) for m in rupee_matches if 500 <= int(m) <= 50000])
+    
+    if all_prices:
+        # Use median of found prices as estimate
+        all_prices.sort()
+        median_price = all_prices[len(all_prices) // 2]
+        # Multiply by 2 for round trip (if not already round trip) and by number of people
+        return median_price if median_price > 3000 else median_price * 2
+    else:
+        # Fallback to category-based estimate
+        raise Exception("No prices found in search results")
+
+
 def estimate_transport_cost(origin: str, destination: str, num_people: int) -> float:
     """
     Estimates round-trip transportation cost from origin to destination using Tavily search.
@@ -137,38 +243,30 @@ def estimate_transport_cost(origin: str, destination: str, num_people: int) -> f
     Returns:
         float: Estimated total round-trip cost in INR for all people
     """
-    try:
-        query = f"cost of travel from {origin} to {destination} India round trip flight train bus fare rupees 2024 2025"
+    per_person = _get_cached_route_cost(origin, destination)
+    if per_person is None:
         response = tavily_client.search(
-            query=query,
+            query=_transport_cost_query(origin, destination),
             search_depth="basic",
             max_results=3
         )
-        
-        # Extract content and look for prices
-        import re
-        all_prices = []
-        for result in response.get('results', []):
-            content = result.get('content', '')
-            # Find rupee amounts
-            rupee_matches = re.findall(r'[₹Rs\.]\s*(\d{1,6})', content)
-            all_prices.extend([int(m) for m in rupee_matches if 500 <= int(m) <= 50000])
-        
-        if all_prices:
-            # Use median of found prices as estimate
-            all_prices.sort()
-            median_price = all_prices[len(all_prices) // 2]
-            # Multiply by 2 for round trip (if not already round trip) and by number of people
-            per_person_round_trip = median_price if median_price > 3000 else median_price * 2
-            total_cost = per_person_round_trip * num_people
-            return total_cost
-        else:
-            # Fallback to category-based estimate
-            raise Exception("No prices found in search results")
-            
-    except Exception as e:
-        # Fallback to category-based estimate
-        raise e
+        per_person = _per_person_cost_from_results(response)
+        _cache_route_cost(origin, destination, per_person)
+    return per_person * num_people
+
+
+async def aestimate_transport_cost(origin: str, destination: str, num_people: int) -> float:
+    """Native async version of estimate_transport_cost (raises the same way when no fares are found)"""
+    per_person = _get_cached_route_cost(origin, destination)
+    if per_person is None:
+        response = await async_tavily_client.search(
+            query=_transport_cost_query(origin, destination),
+            search_depth="basic",
+            max_results=3
+        )
+        per_person = _per_person_cost_from_results(response)
+        _cache_route_cost(origin, destination, per_person)
+    return per_person * num_people
 
 
 def estimate_transport_fallback(origin: str, destination: str, num_people: int) -> float:
@@ -220,6 +318,49 @@ def estimate_transport_fallback(origin: str, destination: str, num_people: int)
     return total_cost
 
 
+def _travel_advisory_queries(city: str) -> list[str]:
+    # Get multiple types of advisories
+    return [
+        f"Current travel safety advisory warnings alerts for {city} India today",
+        f"Weather alerts storms flooding for {city} India current",
+        f"Travel restrictions health advisories {city} India latest"
+    ]
+
+
+def _format_travel_advisory(city: str, responses: list[dict]) -> str:
+    all_results = []
+    for response in responses:
+        for result in response.get('results', []):
+            content = result.get('content', '')[:400]
+            if content and content not in all_results:
+                all_results.append(content)
+    
+    # Analyze severity and determine safety verdict
+    if not all_results:
+        return f"✅ SAFETY VERDICT: SAFE TO TRAVEL\n\n🛡️ No major travel advisories, alerts, or safety concerns found for {city}. Destination is considered safe for travel."
+    
+    # Check for severe warnings
+    combined_text = " ".join(all_results).lower()
+    severe_keywords = ['avoid', 'danger', 'unsafe', 'critical', 'emergency', 'disaster', 'severe', 'extreme', 'prohibited', 'restricted']
+    caution_keywords = ['warning', 'alert', 'caution', 'advisory', 'storm', 'flood', 'rain', 'monitor', 'check']
+    
+    has_severe = any(keyword in combined_text for keyword in severe_keywords)
+    has_caution = any(keyword in combined_text for keyword in caution_keywords)
+    
+    if has_severe:
+        verdict = "⚠️ SAFETY VERDICT: EXERCISE EXTREME CAUTION / CONSIDER POSTPONING"
+        icon = "🚨"
+    elif has_caution:
+        verdict = "⚠️ SAFETY VERDICT: SAFE WITH PRECAUTIONS"
+        icon = "⚠️"
+    else:
+        verdict = "✅ SAFETY VERDICT: GENERALLY SAFE"
+        icon = "ℹ️"
+    
+    alerts_text = "\n\n".join([f"• {r}" for r in all_results])
+    return f"{verdict}\n\n{icon} CURRENT ADVISORIES for {city}:\n\n{alerts_text}"
+
+
 @tool
 def get_travel_advisory(city: str) -> str:
     """
@@ -234,55 +375,45 @@ def get_travel_advisory(city: str) -> str:
         str: Safety verdict + real-time advisories, weather alerts, and travel warnings
     """
     try:
-        # Get multiple types of advisories
-        queries = [
-            f"Current travel safety advisory warnings alerts for {city} India today",
-            f"Weather alerts storms flooding for {city} India current",
-            f"Travel restrictions health advisories {city} India latest"
+        responses = [
+            tavily_client.search(query=query, search_depth="basic", max_results=2)
+            for query in _travel_advisory_queries(city)
         ]
-        
-        all_results = []
-        for query in queries:
-            response = tavily_client.search(
-                query=query,
-                search_depth="basic",
-                max_results=2
-            )
+        return _format_travel_advisory(city, responses)
             
-            for result in response.get('results', []):
-                content = result.get('content', '')[:400]
-                if content and content not in all_results:
-                    all_results.append(content)
-        
-        # Analyze severity and determine safety verdict
-        if not all_results:
-            return f"✅ SAFETY VERDICT: SAFE TO TRAVEL\n\n🛡️ No major travel advisories, alerts, or safety concerns found for {city}. Destination is considered safe for travel."
-        
-        # Check for severe warnings
-        combined_text = " ".join(all_results).lower()
-        severe_keywords = ['avoid', 'danger', 'unsafe', 'critical', 'emergency', 'disaster', 'severe', 'extreme', 'prohibited', 'restricted']
-        caution_keywords = ['warning', 'alert', 'caution', 'advisory', 'storm', 'flood', 'rain', 'monitor', 'check']
-        
-        has_severe = any(keyword in combined_text for keyword in severe_keywords)
-        has_caution = any(keyword in combined_text for keyword in caution_keywords)
-        
-        if has_severe:
-            verdict = "⚠️ SAFETY VERDICT: EXERCISE EXTREME CAUTION / CONSIDER POSTPONING"
-            icon = "🚨"
-        elif has_caution:
-            verdict = "⚠️ SAFETY VERDICT: SAFE WITH PRECAUTIONS"
-            icon = "⚠️"
-        else:
-            verdict = "✅ SAFETY VERDICT: GENERALLY SAFE"
-            icon = "ℹ️"
-        
-        alerts_text = "\n\n".join([f"• {r}" for r in all_results])
-        return f"{verdict}\n\n{icon} CURRENT ADVISORIES for {city}:\n\n{alerts_text}"
+    except Exception as e:
+        return f"⚠️ Could not fetch travel advisories for {city}: {str(e)}\nPlease check official travel advisory websites."
+
+
+async def _aget_travel_advisory(city: str) -> str:
+    """Native async version of get_travel_advisory - the three searches run concurrently"""
+    try:
+        responses = await asyncio.gather(*(
+            async_tavily_client.search(query=query, search_depth="basic", max_results=2)
+            for query in _travel_advisory_queries(city)
+        ))
+        return _format_travel_advisory(city, responses)
             
     except Exception as e:
         return f"⚠️ Could not fetch travel advisories for {city}: {str(e)}\nPlease check official travel advisory websites."
 
 
+get_travel_advisory.coroutine = _aget_travel_advisory
+
+
+def _format_realtime_weather(city: str, response: dict) -> str:
+    results = []
+    for result in response.get('results', []):
+        content = result.get('content', '')[:350]
+        if any(keyword in content.lower() for keyword in ['temperature', 'weather', 'forecast', 'rain', 'sunny', 'cloud']):
+            results.append(content)
+    
+    if results:
+        return f"🌤️ REAL-TIME WEATHER for {city}:\n\n" + "\n\n".join([f"• {r}" for r in results[:2]])
+    else:
+        return f"Weather data temporarily unavailable for {city}. Check local forecasts."
+
+
 @tool
 def get_realtime_weather(city: str) -> str:
     """
@@ -296,28 +427,42 @@ def get_realtime_weather(city: str) -> str:
         str: Current weather, temperature, forecast, best time to visit
     """
     try:
-        query = f"Current weather forecast temperature {city} India today 7 day forecast"
         response = tavily_client.search(
-            query=query,
+            query=f"Current weather forecast temperature {city} India today 7 day forecast",
             search_depth="basic",
             max_results=3
         )
-        
-        results = []
-        for result in response.get('results', []):
-            content = result.get('content', '')[:350]
-            if any(keyword in content.lower() for keyword in ['temperature', 'weather', 'forecast', 'rain', 'sunny', 'cloud']):
-                results.append(content)
-        
-        if results:
-            return f"🌤️ REAL-TIME WEATHER for {city}:\n\n" + "\n\n".join([f"• {r}" for r in results[:2]])
-        else:
-            return f"Weather data temporarily unavailable for {city}. Check local forecasts."
+        return _format_realtime_weather(city, response)
             
     except Exception as e:
         return f"⚠️ Could not fetch weather data for {city}: {str(e)}"
 
 
+async def _aget_realtime_weather(city: str) -> str:
+    """Native async version of get_realtime_weather"""
+    try:
+        response = await async_tavily_client.search(
+            query=f"Current weather forecast temperature {city} India today 7 day forecast",
+            search_depth="basic",
+            max_results=3
+        )
+        return _format_realtime_weather(city, response)
+            
+    except Exception as e:
+        return f"⚠️ Could not fetch weather data for {city}: {str(e)}"
+
+
+get_realtime_weather.coroutine = _aget_realtime_weather
+
+
+def _format_travel_document_info(destination: str, response: dict) -> str:
+    results = []
+    for result in response.get('results', []):
+        results.append(f"- {result.get('content', '')[:300]}...")
+    
+    return f"Travel Document Requirements for {destination}:\n" + "\n".join(results)
+
+
 @tool
 def get_travel_document_info(destination: str) -> str:
     """
@@ -331,22 +476,32 @@ def get_travel_document_info(destination: str) -> str:
         str: Visa and travel document requirements
     """
     try:
-        query = f"Visa requirements and travel documents needed for tourists visiting {destination}"
         response = tavily_client.search(
-            query=query,
+            query=f"Visa requirements and travel documents needed for tourists visiting {destination}",
             search_depth="advanced",
             max_results=3
         )
-        
-        results = []
-        for result in response.get('results', []):
-            results.append(f"- {result.get('content', '')[:300]}...")
-        
-        return f"Travel Document Requirements for {destination}:\n" + "\n".join(results)
+        return _format_travel_document_info(destination, response)
     except Exception as e:
         return f"Error getting travel document info for {destination}: {str(e)}"
 
 
+async def _aget_travel_document_info(destination: str) -> str:
+    """Native async version of get_travel_document_info"""
+    try:
+        response = await async_tavily_client.search(
+            query=f"Visa requirements and travel documents needed for tourists visiting {destination}",
+            search_depth="advanced",
+            max_results=3
+        )
+        return _format_travel_document_info(destination, response)
+    except Exception as e:
+        return f"Error getting travel document info for {destination}: {str(e)}"
+
+
+get_travel_document_info.coroutine = _aget_travel_document_info
+
+
 # ============================================================================
 # PLANNING TOOLS (Used by Main ReAct Agent in Step 5)
 # ============================================================================
@@ -7,7 +7,7 @@ including flights, hotels, trains, buses, and activities.
 """
 
 from typing import Dict, List, Optional
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from urllib.parse import urlencode, quote
 import re
 import random
@@ -963,6 +963,23 @@ class BookingLinksGenerator:
         }
 
 
+# Plain train search page; IRCTC does not accept pre-filled search parameters
+IRCTC_TRAIN_SEARCH_URL = "https://www.irctc.co.in/nget/train-search"
+
+
+def build_mmt_url(origin_iata: str, dest_iata: str, travel_date: date, num_people: int) -> str:
+    """
+    Build a one-way MakeMyTrip flight search URL for the given route and date.
+
+    Format: https://www.makemytrip.com/flight/search?itinerary=BOM-GOI-15/12/2025&tripType=O&paxType=A-2_C-0_I-0&intl=false&cabinClass=E&lang=eng
+    """
+    return (
+        "https://www.makemytrip.com/flight/search"
+        f"?itinerary={origin_iata}-{dest_iata}-{travel_date.strftime('%d/%m/%Y')}"
+        f"&tripType=O&paxType=A-{num_people}_C-0_I-0&intl=false&cabinClass=E&lang=eng"
+    )
+
+
 # Singleton instance
 _booking_links_generator = None
 
@@ -29,6 +29,8 @@ class PublicEventDiscoveryEngine:
         """Initialize with Google API key"""
         self.api_key = google_api_key
         self.base_url = "https://www.googleapis.com/calendar/v3"
+        # Pooled keep-alive connection to the Calendar API, shared by every fetch
+        self.session = requests.Session()
         
         # Known Indian festivals and events database
         self.indian_events_db = self._initialize_indian_events_db()
@@ -310,7 +312,7 @@ class PublicEventDiscoveryEngine:
                     'maxResults': 50
                 }
                 
-                response = requests.get(url, params=params, timeout=10)
+                response = self.session.get(url, params=params, timeout=10)
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -7,12 +7,17 @@ from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional, Tuple
 import uuid
 from collections import defaultdict
+from pydantic import TypeAdapter
 from schemas import (
     Expense, ExpenseCategory, ExpenseTrackerSummary, 
     BudgetAlert, ExpenseAnalyticsResponse
 )
 
 
+# Validates a whole Firestore result set in one pydantic-core call
+_expense_list_adapter = TypeAdapter(List[Expense])
+
+
 class ExpenseTrackerService:
     """
     Service for tracking expenses during trips.
@@ -213,8 +218,6 @@ class ExpenseTrackerService:
         # Calculate summary
         total_budget = trip_data.get('budget', 0)
         total_spent = sum(e.amount for e in expenses)
-        total_remaining = total_budget - total_spent
-        percentage_used = (total_spent / total_budget * 100) if total_budget > 0 else 0
         
         # Calculate daily average
         trip_start = trip_data.get('start_date')
@@ -228,20 +231,8 @@ class ExpenseTrackerService:
         now = datetime.now(timezone.utc)
         days_elapsed = max((now - trip_start).days, 1) if trip_start else 1
         days_remaining = max((trip_end - now).days, 0) if trip_end else 0
-        total_days = days_elapsed + days_remaining
         
         daily_average = total_spent / days_elapsed if days_elapsed > 0 else 0
-        projected_total = daily_average * total_days
-        
-        # Determine budget status
-        if percentage_used >= 100:
-            budget_status = "over-budget"
-        elif percentage_used >= 90:
-            budget_status = "critical"
-        elif projected_total > total_budget:
-            budget_status = "warning"
-        else:
-            budget_status = "on-track"
         
         # Group expenses by category
         categories = self._calculate_category_breakdown(
@@ -252,41 +243,52 @@ class ExpenseTrackerService:
         # Get recent expenses (last 10)
         recent_expenses = sorted(expenses, key=lambda x: x.created_at, reverse=True)[:10]
         
-        # Generate warnings and recommendations
+        summary = ExpenseTrackerSummary(
+            trip_id=trip_id,
+            total_budget=total_budget,
+            total_spent=total_spent,
+            daily_average=round(daily_average, 2),
+            budget_status="on-track",
+            categories=categories,
+            recent_expenses=recent_expenses,
+            total_expenses_count=len(expenses),
+            days_elapsed=days_elapsed,
+            days_remaining=days_remaining
+        )
+        
+        # Status, warnings and recommendations use the summary's own computed
+        # totals, so they always agree with the figures it reports
+        if summary.percentage_used >= 100:
+            budget_status = "over-budget"
+        elif summary.percentage_used >= 90:
+            budget_status = "critical"
+        elif summary.projected_total > total_budget:
+            budget_status = "warning"
+        else:
+            budget_status = "on-track"
+        
         warnings = self._generate_budget_warnings(
             total_budget,
             total_spent,
-            percentage_used,
+            summary.percentage_used,
             categories,
             days_remaining,
-            projected_total
+            summary.projected_total
         )
         
         recommendations = self._generate_spending_recommendations(
             budget_status,
             categories,
-            daily_average,
+            summary.daily_average,
             days_remaining,
-            total_remaining
+            summary.total_remaining
         )
         
-        return ExpenseTrackerSummary(
-            trip_id=trip_id,
-            total_budget=total_budget,
-            total_spent=total_spent,
-            total_remaining=total_remaining,
-            percentage_used=round(percentage_used, 2),
-            daily_average=round(daily_average, 2),
-            projected_total=round(projected_total, 2),
-            budget_status=budget_status,
-            categories=categories,
-            recent_expenses=recent_expenses,
-            total_expenses_count=len(expenses),
-            days_elapsed=days_elapsed,
-            days_remaining=days_remaining,
-            warnings=warnings,
-            recommendations=recommendations
-        )
+        return summary.model_copy(update={
+            "budget_status": budget_status,
+            "warnings": warnings,
+            "recommendations": recommendations
+        })
     
     def get_expense_analytics(
         self,
@@ -544,12 +546,9 @@ class ExpenseTrackerService:
         if not include_deleted:
             query = query.where('deleted', '==', False)
         
-        expenses = []
-        for doc in query.stream():
-            expense_data = doc.to_dict()
-            expenses.append(Expense(**expense_data))
-        
-        return expenses
+        return _expense_list_adapter.validate_python(
+            [doc.to_dict() for doc in query.stream()]
+        )
     
     def _calculate_category_breakdown(
         self,
@@ -568,16 +567,10 @@ class ExpenseTrackerService:
         # Create category objects
         categories = []
         for cat_name, budgeted in budget_breakdown.items():
-            spent = category_spending.get(cat_name, 0)
-            remaining = budgeted - spent
-            percentage = (spent / budgeted * 100) if budgeted > 0 else 0
-            
             categories.append(ExpenseCategory(
                 name=cat_name,
                 budgeted_amount=budgeted,
-                spent_amount=spent,
-                remaining_amount=remaining,
-                percentage_used=round(percentage, 2),
+                spent_amount=category_spending.get(cat_name, 0),
                 expense_count=category_counts.get(cat_name, 0)
             ))
         
@@ -588,9 +581,8 @@ class ExpenseTrackerService:
                     name=cat_name,
                     budgeted_amount=0,
                     spent_amount=spent,
-                    remaining_amount=-spent,
-                    percentage_used=100.0,
-                    expense_count=category_counts[cat_name]
+                    expense_count=category_counts[cat_name],
+                    unbudgeted=True
                 ))
         
         return categories
@@ -804,7 +796,7 @@ class ExpenseTrackerService:
         group_by: str
     ) -> List[Dict]:
         """Group expenses by specified field"""
-        grouped = defaultdict(lambda: {"total": 0, "count": 0, "expenses": []})
+        grouped = defaultdict(lambda: {"total": 0, "count": 0})
         
         for expense in expenses:
             if group_by == "category":
@@ -820,7 +812,6 @@ class ExpenseTrackerService:
             
             grouped[key]["total"] += expense.amount
             grouped[key]["count"] += 1
-            grouped[key]["expenses"].append(expense.dict())
         
         # Convert to list of dicts
         result = []
@@ -1,12 +1,21 @@
 ﻿from firebase_config import get_firestore_client
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 import logging
     
 
 
 logger = logging.getLogger(__name__)
 
+# Trip plan fields needed to list trips; everything except the itinerary text
+# (and the prompt/feedback it was generated from)
+TRIP_SUMMARY_FIELDS = [
+    'title', 'origin_city', 'destination', 'num_days', 'duration', 'num_people',
+    'budget', 'start_date', 'end_date', 'interests', 'trip_status',
+    'is_budget_sufficient', 'estimated_cost', 'budget_breakdown', 'image_url',
+    'created_at', 'updated_at',
+]
+
 class FirestoreService:
     def create_user_profile(self, user_id: str, email: str, name: str = None) -> Dict[str, Any]:
         """Create a new user profile in Firestore"""
@@ -85,12 +94,14 @@ class FirestoreService:
         self.db = get_firestore_client()
         print("[OK] FirestoreService initialized")
     
-    def get_user_trip_plans(self, user_id: str, limit: int = 50) -> List[Dict[str, Any]]:
-        """Get all trip plans for a user"""
+    def get_user_trip_plans(self, user_id: str, limit: int = 50, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Get all trip plans for a user (only `fields` of each, projected server-side, if given)"""
         if not self.db:
             return []
         try:
             trips_ref = self.db.collection('trip_plans').where('user_id', '==', user_id).limit(limit)
+            if fields:
+                trips_ref = trips_ref.select(fields)
             trips = []
             for doc in trips_ref.stream():
                 trip_data = doc.to_dict()
@@ -101,48 +112,85 @@ class FirestoreService:
             logger.error(f"Error getting user trip plans: {str(e)}")
             return []
     
-    def get_trip_plan_by_id(self, trip_id: str, user_id: str) -> Optional[Dict[str, Any]]:
-        """Get a specific trip plan by ID"""
+    def get_trip_plan_by_id(self, trip_id: str, user_id: str, fields: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get a specific trip plan by ID. With `fields`, only those fields (plus
+        user_id, for the ownership check) are read, so callers that don't need
+        the itinerary don't download it.
+        """
         if not self.db:
-            print(f"⚠️ Firestore not initialized")
             return None
         try:
-            print(f"🔍 Looking for trip_id: {trip_id}, user_id: {user_id}")
-            doc = self.db.collection('trip_plans').document(trip_id).get()
-            if doc.exists:
-                print(f"✅ Document found")
-                trip_data = doc.to_dict()
-                trip_owner = trip_data.get('user_id')
-                print(f"   Trip owner: {trip_owner}, Requesting user: {user_id}")
-                if trip_owner == user_id:
-                    trip_data['id'] = doc.id
-                    print(f"✅ User authorized")
-                    return trip_data
-                else:
-                    print(f"❌ User not authorized (owner: {trip_owner}, requester: {user_id})")
-            else:
-                print(f"❌ Document {trip_id} does not exist in trip_plans collection")
-            return None
+            doc_ref = self.db.collection('trip_plans').document(trip_id)
+            doc = doc_ref.get(field_paths=list({*fields, 'user_id'})) if fields else doc_ref.get()
+            if not doc.exists:
+                logger.debug("Trip plan %s not found", trip_id)
+                return None
+            trip_data = doc.to_dict()
+            if trip_data.get('user_id') != user_id:
+                logger.debug("Trip plan %s not owned by requesting user", trip_id)
+                return None
+            trip_data['id'] = doc.id
+            return trip_data
         except Exception as e:
-            print(f"❌ Error getting trip plan: {str(e)}")
             logger.error(f"Error getting trip plan: {str(e)}")
             return None
     
-    def save_trip_plan(self, user_id: str, trip_data: Dict[str, Any]) -> str:
-        """Save a new trip plan"""
+    def get_trip_plan_and_user_profile(self, trip_id: str, user_id: str) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Get a trip plan (only if owned by the user) and the user's profile in one batched read"""
+        if not self.db:
+            return None, None
+        try:
+            trip_ref = self.db.collection('trip_plans').document(trip_id)
+            profile_ref = self.db.collection('user_profiles').document(user_id)
+            # get_all doesn't promise result order, so match documents by path
+            docs = {doc.reference.path: doc for doc in self.db.get_all([trip_ref, profile_ref])}
+
+            trip_data = None
+            trip_doc = docs.get(trip_ref.path)
+            if trip_doc is not None and trip_doc.exists:
+                trip_data = trip_doc.to_dict()
+                if trip_data.get('user_id') == user_id:
+                    trip_data['id'] = trip_doc.id
+                else:
+                    trip_data = None
+
+            profile_data = None
+            profile_doc = docs.get(profile_ref.path)
+            if profile_doc is not None and profile_doc.exists:
+                profile_data = profile_doc.to_dict()
+                profile_data['id'] = profile_doc.id
+            return trip_data, profile_data
+        except Exception as e:
+            logger.error(f"Error getting trip plan and user profile: {str(e)}")
+            return None, None
+    
+    def new_trip_plan_id(self) -> str:
+        """Reserve a trip plan document ID (generated client-side, no Firestore round trip)"""
+        if not self.db:
+            raise Exception("Firestore not initialized")
+        return self.db.collection('trip_plans').document().id
+    
+    def save_trip_plan(self, user_id: str, trip_data: Dict[str, Any], trip_id: Optional[str] = None) -> str:
+        """Save a new trip plan (under `trip_id` if one was reserved with new_trip_plan_id)"""
         if not self.db:
             raise Exception("Firestore not initialized")
         try:
             trip_data['user_id'] = user_id
             trip_data['created_at'] = datetime.utcnow()
             trip_data['updated_at'] = datetime.utcnow()
-            trip_ref = self.db.collection('trip_plans').document()
+            trip_ref = self.db.collection('trip_plans').document(trip_id)
             trip_ref.set(trip_data)
             return trip_ref.id
         except Exception as e:
             logger.error(f"Error saving trip plan: {str(e)}")
             raise
     
+    def _owns_trip(self, doc_ref, user_id: str) -> bool:
+        """Ownership check that reads only the trip's user_id field, not the itinerary"""
+        doc = doc_ref.get(field_paths=['user_id'])
+        return doc.exists and doc.to_dict().get('user_id') == user_id
+    
     def update_trip_plan(self, trip_id: str, user_id: str, updates: Dict[str, Any]) -> bool:
         """Update an existing trip plan"""
         if not self.db:
@@ -150,8 +198,7 @@ class FirestoreService:
         try:
             updates['updated_at'] = datetime.utcnow()
             doc_ref = self.db.collection('trip_plans').document(trip_id)
-            doc = doc_ref.get()
-            if doc.exists and doc.to_dict().get('user_id') == user_id:
+            if self._owns_trip(doc_ref, user_id):
                 doc_ref.update(updates)
                 return True
             return False
@@ -165,8 +212,7 @@ class FirestoreService:
             return False
         try:
             doc_ref = self.db.collection('trip_plans').document(trip_id)
-            doc = doc_ref.get()
-            if doc.exists and doc.to_dict().get('user_id') == user_id:
+            if self._owns_trip(doc_ref, user_id):
                 doc_ref.delete()
                 return True
             return False
@@ -4,7 +4,7 @@ Exports trip itineraries to Google Calendar with one click
 """
 
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
 import re
 import json
 from urllib.parse import quote
@@ -461,7 +461,14 @@ class GoogleCalendarExportService:
         Generate ICS (iCalendar) file content for download.
         Users can import this file into any calendar app (Google Calendar, Outlook, Apple Calendar).
         """
-        ics_lines = [
+        return '\n'.join(self.iter_ics_lines(events, trip_title))
+    
+    def iter_ics_lines(self, events: Iterable[CalendarEvent], trip_title: str) -> Iterator[str]:
+        """
+        Yield the ICS file line by line so download endpoints can stream it
+        instead of buffering the whole calendar in memory.
+        """
+        yield from (
             "BEGIN:VCALENDAR",
             "VERSION:2.0",
             "PRODID:-//Voyage Travel Planner//EN",
@@ -469,18 +476,19 @@ class GoogleCalendarExportService:
             "X-WR-TIMEZONE:Asia/Kolkata",
             "CALSCALE:GREGORIAN",
             "METHOD:PUBLISH",
-        ]
+        )
+        
+        created = datetime.now().strftime('%Y%m%dT%H%M%SZ')
         
         for i, event in enumerate(events):
             # Format times in UTC
             start_utc = event.start_time.strftime('%Y%m%dT%H%M%SZ')
             end_utc = event.end_time.strftime('%Y%m%dT%H%M%SZ')
-            created = datetime.now().strftime('%Y%m%dT%H%M%SZ')
             
             # Clean description (remove newlines, escape special chars)
             description = event.description.replace('\n', '\\n').replace(',', '\\,')
             
-            ics_lines.extend([
+            yield from (
                 "BEGIN:VEVENT",
                 f"UID:voyage-event-{i}@voyage.in",
                 f"DTSTAMP:{created}",
@@ -492,11 +500,9 @@ class GoogleCalendarExportService:
                 "STATUS:CONFIRMED",
                 "SEQUENCE:0",
                 "END:VEVENT",
-            ])
-        
-        ics_lines.append("END:VCALENDAR")
+            )
         
-        return '\n'.join(ics_lines)
+        yield "END:VCALENDAR"
 
 
 # Global service instance
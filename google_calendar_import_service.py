@@ -19,7 +19,8 @@ class GoogleCalendarImportService:
     
     def __init__(self):
         """Initialize the service"""
-        pass
+        # Pooled keep-alive connection to the Calendar API, shared by every fetch
+        self.session = requests.Session()
     
     def fetch_user_calendar_events(
         self,
@@ -61,7 +62,7 @@ class GoogleCalendarImportService:
                 'maxResults': 250
             }
             
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self.session.get(url, headers=headers, params=params, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -3,8 +3,8 @@ Pydantic schemas for the Voyage travel planner application.
 These schemas define the structure of data flowing through the system.
 """
 
-from pydantic import BaseModel, Field, EmailStr
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, Field, EmailStr, computed_field
+from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime
 
 
@@ -14,37 +14,39 @@ class TripDetails(BaseModel):
     This is populated by the Extractor LLM in Step 1 of the orchestrator.
     """
     origin_city: str = Field(
-        description="The city where the traveler is starting from. Use 'Not specified' if not mentioned in the prompt."
+        description="The city where the traveler is starting FROM ('from X', 'leaving from X', 'I'm in X', Hindi 'X se'). Use 'Not specified' if not mentioned in the prompt."
     )
     destination: str = Field(
-        description="The destination city or country the traveler wants to visit. Use 'Not specified' if not mentioned in the prompt."
+        description="The destination city or country the traveler wants to GO to ('to X', 'visit X', 'X trip', Hindi 'X ghumne jana' / 'X jaana hai'). If vague like 'hill station near Bengaluru', suggest specific places ('Coorg or Ooty'). Use 'Not specified' if not mentioned in the prompt."
     )
     num_days: int = Field(
-        description="Number of days for the trip. Use 0 if not mentioned. Can infer from 'weekend' (2-3), 'week' (7), etc.",
+        description="Number of days for the trip ('X days', Hindi 'X din ke liye'). 'weekend' or 'quick trip' = 2-3, 'week' = 7, 'X nights' = X+1. Use 0 if not mentioned.",
         ge=0  # Changed from gt=0 to ge=0 to allow 0 (will be validated later)
     )
     num_people: int = Field(
-        description="Number of people traveling. Default to 1 if not mentioned. Can infer from 'family' (~4), 'couple' (2), 'solo' (1), etc.",
+        description="Number of people traveling ('X people', Hindi 'X log'). 'family of X' = X, 'my family' = 4, 'couple' or 'me and my friend' = 2, 'solo' = 1. Default to 1 if not mentioned.",
         ge=0  # Changed from gt=0 to ge=0 to allow 0 (will be validated later)
     )
     budget: float = Field(
-        description="Total budget for the trip in Indian Rupees (₹). Use 0 if not mentioned. Can estimate from keywords: 'cheap' (~₹20k-40k), 'budget' (~₹40k-60k), 'comfortable' (~₹60k-80k), 'luxury' (~₹80k+).",
+        description="Total budget for the trip in Indian Rupees (₹) ('₹X', 'X rupees', Hindi 'budget X hai'). Use 0 if not mentioned. Can estimate from keywords: 'cheap' / 'budget-friendly' (~₹20k for a weekend, ~₹40k for a week), 'comfortable' (~₹50k-70k), 'luxury' (~₹80k+).",
         ge=0  # Changed from gt=0 to ge=0 to allow 0 (will be validated later)
     )
     start_date: Optional[str] = Field(
         default=None,
-        description="Trip start date in YYYY-MM-DD format if mentioned (e.g., 'next week', 'December 15', '15th Dec'). Use None if not specified."
+        description="Trip start date in YYYY-MM-DD format, resolved against today's date: 'next week' = today + 7 days, 'next month' (Hindi 'agla mahina') = first week of next month, 'this weekend' = upcoming Saturday, a bare month = first week of that month. Use None if not specified."
     )
     interests: Optional[str] = Field(
         default=None,
-        description="Optional: Traveler's interests (e.g., adventure, culture, food)"
+        description="Optional: Traveler's interests (e.g., adventure, beaches, culture, food, religious, nature, shopping, party)"
     )
     preferred_language: Optional[str] = Field(
         default="English",
-        description="Detected language from user's input (English, Hindi, Tamil, Telugu, Bengali, Marathi, etc.)"
+        description="Detected language from user's input (English, Hindi, Tamil, Telugu, Bengali, Marathi, Gujarati, etc.). Romanized Hindi such as 'goa jaana hai' is Hindi. Default English."
     )
     
     class Config:
+        # Immutable once extracted: hashable and safe to share across cached prompts
+        frozen = True
         json_schema_extra = {
             "example": {
                 "origin_city": "Delhi",
@@ -59,6 +61,31 @@ class TripDetails(BaseModel):
         }
 
 
+class TripDetailsWithIntent(TripDetails):
+    """
+    TripDetails plus the classified intent of the message, so intent detection
+    and extraction share one LLM call. The trip fields hold their "not
+    mentioned" defaults when the message is not a trip-planning request.
+    """
+    intent: Literal[
+        "TRIP_PLANNING",
+        "MODIFICATION_REQUEST",
+        "DESTINATION_INQUIRY",
+        "RECOMMENDATION",
+        "ADVICE",
+        "GREETING",
+        "OTHER"
+    ] = Field(
+        description=(
+            "What the user wants: TRIP_PLANNING (gives a destination plus any of days/budget/origin, or clearly wants an itinerary), "
+            "MODIFICATION_REQUEST (asks to change a plan - 'use whole budget', 'upgrade' - without complete trip details), "
+            "DESTINATION_INQUIRY ('tell me about Kashmir'), RECOMMENDATION ('where should I go?', 'best hill stations'), "
+            "ADVICE ('what to pack', 'best time to visit', 'safety tips'), GREETING (greetings, thanks, social messages) "
+            "or OTHER (cannot determine / very generic)"
+        )
+    )
+
+
 class TripRequest(BaseModel):
     """
     Schema for the incoming API request.
@@ -71,12 +98,17 @@ class TripRequest(BaseModel):
         default=None,
         description="Previously extracted trip details from incomplete request (for conversation continuity)"
     )
+    stream: bool = Field(
+        default=False,
+        description="Stream the reply (conversational answer or generated trip plan) as Server-Sent Events instead of one JSON response"
+    )
     
     class Config:
         json_schema_extra = {
             "example": {
                 "prompt": "I want to plan a 7-day trip to Paris for 2 people with a budget of $3000",
-                "previous_extraction": None
+                "previous_extraction": None,
+                "stream": False
             }
         }
 
@@ -1009,9 +1041,12 @@ class CalendarEvent(BaseModel):
     location: str = Field(description="Event location")
     start_time: datetime = Field(description="Event start time")
     end_time: datetime = Field(description="Event end time")
-    event_type: str = Field(description="Type: flight, hotel, activity, transport, trip_day")
+    event_type: Literal["flight", "hotel", "activity", "transport", "trip_day"] = Field(description="Type: flight, hotel, activity, transport, trip_day")
     day_number: Optional[int] = Field(default=None, description="Day number in itinerary")
     is_all_day: bool = Field(default=False, description="Whether this is an all-day event")
+    
+    class Config:
+        frozen = True
 
 
 class GoogleCalendarExportRequest(BaseModel):
@@ -1056,6 +1091,9 @@ class UserCalendarEvent(BaseModel):
     is_all_day: bool = Field(default=False, description="Is this an all-day event")
     is_recurring: bool = Field(default=False, description="Is this a recurring event")
     attendees: Optional[List[str]] = Field(default=None, description="List of attendee emails")
+    
+    class Config:
+        frozen = True
 
 
 class FreeTimeSlot(BaseModel):
@@ -1068,6 +1106,9 @@ class FreeTimeSlot(BaseModel):
     date: str = Field(description="Date (YYYY-MM-DD)")
     is_weekend: bool = Field(description="Is this a weekend day")
     is_full_day: bool = Field(description="Is this a full free day")
+    
+    class Config:
+        frozen = True
 
 
 class FindFreeWeekendRequest(BaseModel):
@@ -1125,9 +1166,24 @@ class ExpenseCategory(BaseModel):
     name: str = Field(description="Category name (e.g., Food, Transport, Accommodation)")
     budgeted_amount: float = Field(description="Originally budgeted amount for this category")
     spent_amount: float = Field(default=0.0, description="Amount spent so far")
-    remaining_amount: float = Field(description="Remaining budget")
-    percentage_used: float = Field(description="Percentage of budget used")
     expense_count: int = Field(default=0, description="Number of expenses in this category")
+    unbudgeted: bool = Field(default=False, exclude=True, description="Spending logged against a category missing from the budget breakdown")
+    
+    class Config:
+        frozen = True
+    
+    @computed_field(description="Remaining budget")
+    @property
+    def remaining_amount(self) -> float:
+        return self.budgeted_amount - self.spent_amount
+    
+    @computed_field(description="Percentage of budget used")
+    @property
+    def percentage_used(self) -> float:
+        if self.budgeted_amount > 0:
+            return round(self.spent_amount / self.budgeted_amount * 100, 2)
+        # Spending against an unbudgeted category counts as fully used
+        return 100.0 if self.unbudgeted else 0.0
 
 
 class Expense(BaseModel):
@@ -1147,6 +1203,9 @@ class Expense(BaseModel):
     is_shared: bool = Field(default=False, description="Is this a shared expense?")
     split_with: List[str] = Field(default=[], description="User IDs to split expense with")
     created_at: datetime = Field(description="When expense was logged")
+    
+    class Config:
+        frozen = True
 
 
 class AddExpenseRequest(BaseModel):
@@ -1175,11 +1234,8 @@ class ExpenseTrackerSummary(BaseModel):
     trip_id: str = Field(description="Trip ID")
     total_budget: float = Field(description="Total trip budget")
     total_spent: float = Field(description="Total amount spent so far")
-    total_remaining: float = Field(description="Total remaining budget")
-    percentage_used: float = Field(description="Percentage of budget used")
     daily_average: float = Field(description="Average spending per day")
-    projected_total: float = Field(description="Projected total spend at current rate")
-    budget_status: str = Field(description="Status: on-track, over-budget, under-budget")
+    budget_status: Literal["on-track", "warning", "critical", "over-budget", "under-budget"] = Field(description="Status: on-track, warning, critical, over-budget, under-budget")
     categories: List[ExpenseCategory] = Field(description="Breakdown by category")
     recent_expenses: List[Expense] = Field(description="Recent expenses")
     total_expenses_count: int = Field(description="Total number of expenses logged")
@@ -1187,19 +1243,39 @@ class ExpenseTrackerSummary(BaseModel):
     days_remaining: int = Field(description="Days remaining in trip")
     warnings: List[str] = Field(default=[], description="Budget warnings and alerts")
     recommendations: List[str] = Field(default=[], description="AI spending recommendations")
+    
+    @computed_field(description="Total remaining budget")
+    @property
+    def total_remaining(self) -> float:
+        return self.total_budget - self.total_spent
+    
+    @computed_field(description="Percentage of budget used")
+    @property
+    def percentage_used(self) -> float:
+        if self.total_budget > 0:
+            return round(self.total_spent / self.total_budget * 100, 2)
+        return 0.0
+    
+    @computed_field(description="Projected total spend at current rate")
+    @property
+    def projected_total(self) -> float:
+        return round(self.daily_average * (self.days_elapsed + self.days_remaining), 2)
 
 
 class BudgetAlert(BaseModel):
     """Budget alert/notification"""
     alert_id: str = Field(description="Alert identifier")
     trip_id: str = Field(description="Trip ID")
-    alert_type: str = Field(description="Type: warning, critical, info")
+    alert_type: Literal["warning", "critical", "info"] = Field(description="Type: warning, critical, info")
     category: Optional[str] = Field(default=None, description="Category related to alert")
     message: str = Field(description="Alert message")
     threshold: float = Field(description="Budget threshold that triggered alert")
     current_value: float = Field(description="Current value")
     created_at: datetime = Field(description="When alert was created")
     is_read: bool = Field(default=False, description="Has user seen this alert?")
+    
+    class Config:
+        frozen = True
 
 
 class GetExpenseTrackerRequest(BaseModel):
@@ -1211,7 +1287,7 @@ class GetExpenseTrackerRequest(BaseModel):
 class ExpenseAnalyticsRequest(BaseModel):
     """Request for expense analytics"""
     trip_id: str = Field(description="Trip ID")
-    group_by: str = Field(default="category", description="Group by: category, day, location, payment_method")
+    group_by: Literal["category", "day", "location", "payment_method"] = Field(default="category", description="Group by: category, day, location, payment_method")
     start_date: Optional[datetime] = Field(default=None, description="Filter start date")
     end_date: Optional[datetime] = Field(default=None, description="Filter end date")
 
@@ -1229,7 +1305,7 @@ class ExpenseAnalyticsResponse(BaseModel):
 class SplitExpenseRequest(BaseModel):
     """Request to split an expense among multiple people"""
     expense_id: str = Field(description="Expense to split")
-    split_type: str = Field(default="equal", description="Split type: equal, custom, percentage")
+    split_type: Literal["equal", "custom", "percentage"] = Field(default="equal", description="Split type: equal, custom, percentage")
     split_details: List[Dict] = Field(description="Split details per user")
 
 
@@ -1244,7 +1320,7 @@ class BudgetAdjustmentRequest(BaseModel):
 class ExportExpensesRequest(BaseModel):
     """Request to export expenses"""
     trip_id: str = Field(description="Trip ID")
-    format: str = Field(default="csv", description="Export format: csv, pdf, excel")
+    format: Literal["csv", "pdf", "excel"] = Field(default="csv", description="Export format: csv, pdf, excel")
     include_receipts: bool = Field(default=False, description="Include receipt images?")
 
 
@@ -1272,21 +1348,24 @@ class TripSummaryCard(BaseModel):
     destination: str = Field(description="Trip destination")
     start_date: datetime = Field(description="Trip start date")
     end_date: datetime = Field(description="Trip end date")
-    status: str = Field(description="Trip status: upcoming, ongoing, completed")
+    status: Literal["upcoming", "ongoing", "completed"] = Field(description="Trip status: upcoming, ongoing, completed")
     total_budget: float = Field(description="Total trip budget")
     total_spent: float = Field(description="Amount spent so far")
     percentage_used: float = Field(description="Percentage of budget used")
-    budget_status: str = Field(description="on-track, warning, critical, over-budget")
+    budget_status: Literal["on-track", "warning", "critical", "over-budget"] = Field(description="on-track, warning, critical, over-budget")
     days_remaining: int = Field(description="Days remaining in trip")
     expense_count: int = Field(description="Number of expenses logged")
     last_expense_date: Optional[datetime] = Field(default=None, description="When last expense was logged")
     alerts_count: int = Field(default=0, description="Number of unread budget alerts")
+    
+    class Config:
+        frozen = True
 
 
 class RecentActivity(BaseModel):
     """Recent activity item for dashboard feed"""
     activity_id: str = Field(description="Activity ID")
-    activity_type: str = Field(description="Type: expense_added, budget_alert, trip_created, etc.")
+    activity_type: Literal["expense_added", "budget_alert", "trip_created"] = Field(description="Type: expense_added, budget_alert, trip_created")
     trip_id: str = Field(description="Related trip ID")
     trip_name: str = Field(description="Trip destination name")
     title: str = Field(description="Activity title")
@@ -1296,18 +1375,24 @@ class RecentActivity(BaseModel):
     timestamp: datetime = Field(description="When activity occurred")
     icon: str = Field(description="Icon identifier for UI")
     color: str = Field(description="Color for UI badge")
+    
+    class Config:
+        frozen = True
 
 
 class BudgetInsight(BaseModel):
     """AI-generated budget insight"""
     insight_id: str = Field(description="Insight ID")
-    type: str = Field(description="Type: tip, warning, achievement, recommendation")
+    type: Literal["tip", "warning", "achievement", "recommendation"] = Field(description="Type: tip, warning, achievement, recommendation")
     title: str = Field(description="Insight title")
     message: str = Field(description="Insight message")
     action: Optional[str] = Field(default=None, description="Suggested action")
-    priority: str = Field(description="Priority: high, medium, low")
+    priority: Literal["high", "medium", "low"] = Field(description="Priority: high, medium, low")
     trip_id: Optional[str] = Field(default=None, description="Related trip if applicable")
     created_at: datetime = Field(description="When insight was generated")
+    
+    class Config:
+        frozen = True
 
 
 class UserDashboard(BaseModel):
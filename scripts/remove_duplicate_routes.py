@@ -12,6 +12,7 @@ Run from backend/ directory: python scripts/remove_duplicate_routes.py
 import re
 import shutil
 import time
+from itertools import compress
 from pathlib import Path
 
 BASE = Path(__file__).resolve().parents[1]  # backend/
@@ -81,12 +82,12 @@ while idx < n:
 
 # Now remove duplicate function blocks by function name, keep first occurrence
 seen = set()
-to_remove = [False] * n
+# One byte per line: 1 = drop, 0 = keep
+to_remove = bytearray(n)
 for (s, e, name) in blocks:
     if name in seen:
         # mark lines s..e-1 for removal
-        for i in range(s, e):
-            to_remove[i] = True
+        to_remove[s:e] = b"\x01" * (e - s)
         print(f"Marked duplicate function '{name}' (lines {s+1}-{e}) for removal")
     else:
         seen.add(name)
@@ -102,11 +103,10 @@ shutil.copy2(SERVER, bak)
 print(f"Backup written to: {bak}")
 
 # Write cleaned file
-new_lines = [lines[i] for i in range(n) if not to_remove[i]]
-with SERVER.open('w', encoding='utf-8') as f:
-    f.writelines(new_lines)
+new_lines = compress(lines, (not flag for flag in to_remove))
+SERVER.write_text(''.join(new_lines), encoding='utf-8')
 
 print(f"Wrote cleaned file: {SERVER}")
-removed_count = sum(1 for x in to_remove if x)
+removed_count = to_remove.count(1)
 print(f"Removed {removed_count} lines ({len(blocks) - len(seen)} duplicate function blocks removed)")
 print("Done.")
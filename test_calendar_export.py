@@ -441,9 +441,44 @@ We'll test:
 """)
 
 
+def test_ics_streaming():
+    """Streamed ICS lines must produce the same file as generate_ics_file"""
+    print_header("📡 TEST: Streamed ICS Generation")
+    
+    service = GoogleCalendarExportService(MockFirestore())
+    start = datetime(2025, 12, 15, 9, 0)
+    events = [
+        CalendarEvent(
+            title=f"📍 Activity {i}",
+            description="Line one\nLine two, with comma",
+            location="Goa",
+            start_time=start + timedelta(hours=i),
+            end_time=start + timedelta(hours=i + 1),
+            event_type="activity",
+            day_number=1
+        )
+        for i in range(3)
+    ]
+    
+    lines = list(service.iter_ics_lines(iter(events), "Goa Trip"))
+    
+    assert lines[0] == "BEGIN:VCALENDAR"
+    assert lines[-1] == "END:VCALENDAR"
+    assert lines.count("BEGIN:VEVENT") == len(events)
+    assert "DESCRIPTION:Line one\\nLine two\\, with comma" in lines
+    
+    # DTSTAMP is the generation time, so compare everything else
+    without_stamp = lambda ls: [l for l in ls if not l.startswith("DTSTAMP:")]
+    full_file = service.generate_ics_file(events, "Goa Trip")
+    assert without_stamp(lines) == without_stamp(full_file.split("\n"))
+    
+    print(f"✅ Streamed {len(lines)} ICS lines for {len(events)} events")
+
+
 if __name__ == "__main__":
     try:
         test_calendar_export()
+        test_ics_streaming()
     except Exception as e:
         print(f"\n❌ Test failed: {str(e)}")
         import traceback